@@ -117,6 +117,7 @@ setup(**{
     "package_data": {
         "solo": [
             "dat/*.dat",
+            "dat/*.npy",
         ],
     },
     "python_requires":
@@ -21,22 +21,63 @@
 
 from __future__ import division
 from collections import namedtuple
-import os.path
 import numpy as np
+from . _spectral import ABSCOEF
+from . _spectral import ABSCOEF_PATH  # noqa: F401 pylint: disable=unused-import
+from . _spectral import DIRFOLD  # noqa: F401 pylint: disable=unused-import
+from . _spectral import _ozone_coef
+from . _spectral import _water_tau
+from . _spectral import _oxygen_tau
+from . _spectral import _rayleigh_tau0
 
 
 ATTRS = ["p", "rho", "o3", "h2o", "alpha", "beta", "w0", "g"]
 
+# Define the descriptive names and the valid ranges of the attributes.
+ATTRS_NAMES = [
+    "pressure", "albedo", "ozone", "water vapour", "Angstrom alpha",
+    "Angstrom beta", "single scattering albedo", "asymmetry parameter",
+]
+ATTRS_MIN = np.array([0, 0, 0, 0, 0, 0, 0, -1], dtype=float)
+ATTRS_MAX = np.array([np.inf, 1, np.inf, np.inf, np.inf, np.inf, 1, 1])
+
+# Container for the attributes reshaped as column arrays.
+_Columns = namedtuple("_Columns", ATTRS)
+
 # Define the default values for optional atmospheric input arguments.
 DEFAULT_P = 1013.
+INV_DEFAULT_P = 1. / DEFAULT_P
 DEFAULT_W0 = 0.90
 DEFAULT_G = 0.85
 
-# Load the array of molecular absorption coefficients in read-only mode.
-DIRFOLD = os.path.dirname(os.path.abspath(__file__))
-ABSCOEF_PATH = os.path.join(os.path.dirname(DIRFOLD), "dat", "abscoef.dat")
-ABSCOEF = np.loadtxt(ABSCOEF_PATH, usecols=(0, 1, 2, 3, 4)).T
-ABSCOEF.flags.writeable = False
+
+def _check_out(out, shape):
+    """Raise a ValueError if `out` cannot store a float array of `shape`."""
+
+    if out is not None:
+        if not isinstance(out, np.ndarray) or out.dtype != float:
+            raise ValueError("'out' must be a float array")
+        if out.shape != shape:
+            msg = "'out' must have shape {0}".format(shape)
+            raise ValueError(msg)
+
+
+def _trn_masked(active, tau, out=None):
+    """Return the transmittance for an absorption term `tau`.
+
+    The absorption term is only given for the wavelengths in the boolean
+    mask `active`, and the transmittance is 1 for the other wavelengths.
+    The array `tau` is overwritten along the computation.
+    """
+
+    shape = (tau.shape[0], active.size)
+    _check_out(out, shape)
+    trn = np.empty(shape) if out is None else out
+    trn.fill(1.)
+    np.negative(tau, out=tau)
+    np.exp(tau, out=tau)
+    trn[:, active] = tau
+    return trn
 
 
 class Atmosphere(namedtuple("Atmosphere", ATTRS)):
@@ -70,56 +111,77 @@ class Atmosphere(namedtuple("Atmosphere", ATTRS)):
         aerosol asymmetry parameter; if not given, it defaults to 0.85
     """
 
+    # Attributes as `(nscen, 1)` column views, set when creating instances.
+    _cols = _Columns(*[None] * len(ATTRS))
+
     def __new__(cls, p, rho, o3, h2o,  # pylint: disable=too-many-arguments
                 alpha, beta, w0=None, g=None):
         """Return a new :class:`Atmosphere` instance."""
 
-        # Ensure that the input arguments have consistent shapes and sizes.
-        items = [p, rho, o3, h2o, alpha, beta]
-        items = items + [x for x in [w0, g] if x is not None]
-        set_shapes = set(np.shape(x) for x in items)
-        if len(set_shapes) > 1:
-            raise AttributeError("size mismatch among input arguments")
-        set_shapes = list(set_shapes)[0]
-        if len(set_shapes) > 1:
-            raise AttributeError("input arguments must be 0- or 1-dimensional")
-
-        # Ensure that the input arguments are within range and set the default
-        # values for `w0` and `g` if they were not defined.
-        p = np.atleast_1d(p)
-        if np.any(p < 0):
-            raise ValueError("pressure out of range")
-        rho = np.atleast_1d(rho)
-        if np.any(rho < 0) or np.any(rho > 1):
-            raise ValueError("albedo out of range")
-        o3 = np.atleast_1d(o3)
-        if np.any(o3 < 0):
-            raise ValueError("ozone out of range")
-        h2o = np.atleast_1d(h2o)
-        if np.any(h2o < 0):
-            raise ValueError("water vapour out of range")
-        alpha = np.atleast_1d(alpha)
-        if np.any(alpha < 0):
-            raise ValueError("Angstrom alpha out of range")
-        beta = np.atleast_1d(beta)
-        if np.any(beta < 0):
-            raise ValueError("Angstrom beta out of range")
-        if w0 is None:
-            w0 = np.full(shape=set_shapes, fill_value=DEFAULT_W0, dtype=float)
-        elif np.any(w0 < 0) or np.any(w0 > 1):
-            raise ValueError("single scattering albedo out of range")
-        w0 = np.atleast_1d(w0)
-        if g is None:
-            g = np.full(shape=set_shapes, fill_value=DEFAULT_G, dtype=float)
-        elif np.any(np.abs(g) > 1):
-            raise ValueError("asymmetry parameter out of range")
-        g = np.atleast_1d(g)
-
-        # Return the new instance.
-        args = [cls, p, rho, o3, h2o, alpha, beta, w0, g]
-        atm = super(Atmosphere, cls).__new__(*args)
+        # Set the default values for `w0` and `g` if they were not defined.
+        values = [p, rho, o3, h2o, alpha, beta,
+                  DEFAULT_W0 if w0 is None else w0,
+                  DEFAULT_G if g is None else g]
+
+        if all(isinstance(item, (int, float)) and
+               not isinstance(item, bool) for item in values):
+            # Fast path for scalar inputs, whose ranges are checked in pure
+            # Python before storing them as the rows of a single array. As
+            # in the array path, NaN values pass the range checks.
+            limits = zip(ATTRS_NAMES, values, ATTRS_MIN, ATTRS_MAX)
+            for name, value, vmin, vmax in limits:
+                if value < vmin or value > vmax:
+                    raise ValueError("{0} out of range".format(name))
+            data = np.array(values, dtype=float)[:, None]
+        else:
+            # Ensure that the input arguments have consistent shapes and
+            # sizes.
+            shape = np.shape(p)
+            for item in [rho, o3, h2o, alpha, beta, w0, g]:
+                if item is not None and np.shape(item) != shape:
+                    raise AttributeError("size mismatch among input arguments")
+            if len(shape) > 1:
+                msg = "input arguments must be 0- or 1-dimensional"
+                raise AttributeError(msg)
+
+            # Store the attributes as the rows of a single contiguous array,
+            # rejecting non-numeric inputs that would be silently cast.
+            nscen = shape[0] if shape else 1
+            data = np.empty((len(ATTRS), nscen), dtype=float)
+            for name, row, value in zip(ATTRS_NAMES, data, values):
+                if np.asarray(value).dtype.kind not in "biuf":
+                    raise TypeError("{0} must be numeric".format(name))
+                row[...] = value
+
+            # Ensure that the input arguments are within range by checking
+            # the extreme values of every attribute at once. NaN values are
+            # ignored when computing them, so that they cannot hide the
+            # out-of-range values of other scenarios.
+            if nscen:
+                invalid = ((np.fmin.reduce(data, axis=1) < ATTRS_MIN) |
+                           (np.fmax.reduce(data, axis=1) > ATTRS_MAX))
+                if invalid.any():
+                    name = ATTRS_NAMES[np.argmax(invalid)]
+                    raise ValueError("{0} out of range".format(name))
+
+        # Create the new instance directly from the rows of the array, and
+        # keep the attributes as `(nscen, 1)` column views, which is the
+        # layout used by the per-call methods.
+        atm = tuple.__new__(cls, data)
+        atm._cols = _Columns(*data[:, :, None])
         return atm
 
+    @classmethod
+    def _make(cls, iterable):  # pylint: disable=arguments-differ
+        """Return a new :class:`Atmosphere` instance from an iterable."""
+
+        return cls(*iterable)
+
+    def __reduce__(self):
+        """Return the arguments to rebuild the instance through `__new__`."""
+
+        return (self.__class__, tuple(self))
+
     @property
     def nscen(self):
         """Number of scenarios stored by the instance."""
@@ -145,7 +207,19 @@ class Atmosphere(namedtuple("Atmosphere", ATTRS)):
 
         return ABSCOEF
 
-    def tau_rayleigh(self, wvln_um, return_albedo=False):
+    def _mu0_column(self, mu0):
+        """Return `mu0` as a column array after checking its shape."""
+
+        mu0 = np.asarray(mu0, dtype=float)
+        if mu0.ndim > 1:
+            raise ValueError("'mu0' must be 0- or 1-dimensional")
+        mu0 = mu0.reshape(-1, 1)
+        if self.nscen != 1 and mu0.shape[0] not in [1, self.nscen]:
+            msg = "mismatch in shapes of 'mu0' and the Atmosphere instance"
+            raise IndexError(msg)
+        return mu0
+
+    def tau_rayleigh(self, wvln_um, return_albedo=False, out=None):
         r"""Return the Rayleigh optical depth for the given wavelengths.
 
         The optical depth is computed by using the Bates' formula:
@@ -174,6 +248,10 @@ class Atmosphere(namedtuple("Atmosphere", ATTRS)):
             if True, return also the Rayleigh contribution to the
             atmospheric albedo
 
+        out : array-like, optional
+            array with shape ``(nscen, nwvln)`` where the optical thickness is
+            stored; if not given, a new array is allocated
+
         Returns
         -------
 
@@ -201,24 +279,26 @@ class Atmosphere(namedtuple("Atmosphere", ATTRS)):
         if not isinstance(return_albedo, bool):
             raise TypeError("'return_albedo' must be a bool")
 
-        # Define the coefficients used in Bates' formula.
-        c = [117.2594, -1.3215, 0.000320, -0.000076]
-
         # Broadcast arrays before the computation of `tau`.
         wvln_um = np.atleast_1d(wvln_um)
-        pressure = self.p[:, None]
+        pressure = self._cols.p
 
         # Compute the optical thickness using Bates' formula, which must be
         # corrected with the real pressure because the original formula is
-        # only valid for an atmospheric pressure of 1 atm.
-        wvln_um2 = wvln_um**2
-        wvln_um4 = wvln_um2**2
-        div = c[0] * wvln_um4 + c[1] * wvln_um2 + c[2] + c[3] / wvln_um4
-        tau = (pressure / DEFAULT_P) / div
+        # only valid for an atmospheric pressure of 1 atm. The wavelength
+        # dependence is memoized, so that the full `(nscen, nwvln)` result
+        # only requires a multiplication.
+        tau0 = _rayleigh_tau0(wvln_um)
+        tau = np.multiply(pressure * INV_DEFAULT_P, tau0, out=out)
 
         # If requested, calc Rayleigh contribution to the atmospheric albedo.
+        # The expression is evaluated in place to limit full-size temporaries.
         if return_albedo:
-            salb = tau * (1. - np.exp(-2. * tau)) / (2. + tau)
+            salb = np.multiply(-2., tau)
+            np.exp(salb, out=salb)
+            np.subtract(1., salb, out=salb)
+            salb *= tau
+            salb /= 2. + tau
             salb = (salb,)
         else:
             salb = ()
@@ -226,7 +306,7 @@ class Atmosphere(namedtuple("Atmosphere", ATTRS)):
         out = (tau,) + salb
         return out if len(out) > 1 else out[0]
 
-    def tau_aerosols(self, wvln_um, return_albedo=False):
+    def tau_aerosols(self, wvln_um, return_albedo=False, out=None):
         r"""Return the aerosol optical depth for the given wavelengths.
 
         The optical depth is computed by using the Angstrom's formula:
@@ -247,6 +327,10 @@ class Atmosphere(namedtuple("Atmosphere", ATTRS)):
             if True, return also the aerosol contribution to the
             atmospheric albedo
 
+        out : array-like, optional
+            array with shape ``(nscen, nwvln)`` where the optical thickness is
+            stored; if not given, a new array is allocated
+
         Returns
         -------
 
@@ -276,15 +360,19 @@ class Atmosphere(namedtuple("Atmosphere", ATTRS)):
 
         # Broadcast arrays before the computation of `tau`.
         wvln_um = np.atleast_1d(wvln_um)
-        alpha = self.alpha[:, None]
-        beta = self.beta[:, None]
+        alpha = self._cols.alpha
+        beta = self._cols.beta
 
-        # Compute the optical thickness using Angstrom's formula.
-        tau = beta / wvln_um**alpha
+        # Compute the optical thickness using Angstrom's formula. The power
+        # is evaluated in place as an exponential of the wavelength logarithm,
+        # which is much faster than the generic power with array exponents.
+        tau = np.multiply(-alpha, np.log(wvln_um), out=out)
+        np.exp(tau, out=tau)
+        tau *= beta
 
         # If requested, calc aerosol contribution to the atmospheric albedo.
         if return_albedo:
-            g = ((1 - self.g) * self.w0)[:, None]
+            g = (1 - self._cols.g) * self._cols.w0
             salb = g * tau / (2. + g * tau) * (1. + np.exp(-g * tau))
             salb = (salb,)
         else:
@@ -367,25 +455,29 @@ class Atmosphere(namedtuple("Atmosphere", ATTRS)):
 
         # Ensure the shape of `mu0`. The other arguments are checked when
         # calling the method `tau_rayleigh`.
-        if np.ndim(mu0) > 1:
-            raise ValueError("'mu0' must be 0- or 1-dimensional")
-        mu0 = np.atleast_1d(mu0)[:, None]
-        if self.nscen != 1 and mu0.shape[0] not in [1, self.nscen]:
-            msg = "mismatch in shapes of 'mu0' and the Atmosphere instance"
-            raise IndexError(msg)
+        mu0 = self._mu0_column(mu0)
 
         # Compute the optical thickness and the atmospheric albedo.
         args = [wvln_um, return_albedo]
         out = self.tau_rayleigh(*args)
         tau, salb = (out[0], (out[1],)) if return_albedo else (out, ())
 
+        # Allocate the three transmittances as a single array.
+        tglb, tdir, tdif = np.empty((3,) + np.broadcast(tau, mu0).shape)
+
         # Compute the Rayleigh direct transmittance.
-        tdir = np.exp(-1.0 * tau / mu0)
+        np.multiply(tau, -1. / mu0, out=tdir)
+        np.exp(tdir, out=tdir)
 
-        # Compute the global and diffuse transmittances.
+        # Compute the global and diffuse transmittances. The expressions are
+        # evaluated in place, and the diffuse array is used as scratch space
+        # for the denominator before holding its final values.
         c = [2. / 3., 4. / 3.]
-        tglb = ((c[0] + mu0) + (c[0] - mu0) * tdir) / (c[1] + tau)
-        tdif = tglb - tdir
+        np.multiply(c[0] - mu0, tdir, out=tglb)
+        tglb += c[0] + mu0
+        np.add(c[1], tau, out=tdif)
+        tglb /= tdif
+        np.subtract(tglb, tdir, out=tdif)
 
         out = (tglb, tdir, tdif) + salb
         return out
@@ -477,18 +569,13 @@ class Atmosphere(namedtuple("Atmosphere", ATTRS)):
         # arguments are already checked when calling the method `tau_aerosols`.
         if not isinstance(coupling, bool):
             raise TypeError("'coupling' must be a bool")
-        if np.ndim(mu0) > 1:
-            raise ValueError("'mu0' must be 0- or 1-dimensional")
-        mu0 = np.atleast_1d(mu0)[:, None]
-        if self.nscen != 1 and mu0.shape[0] not in [1, self.nscen]:
-            msg = "mismatch in shapes of 'mu0' and the Atmosphere instance"
-            raise IndexError(msg)
+        mu0 = self._mu0_column(mu0)
 
         # Compute the optical thickness and the atmospheric albedo.
         args = [wvln_um, return_albedo]
         out = self.tau_aerosols(*args)
         tau, salb = (out[0], out[1]) if return_albedo else (out, ())
-        g, w0 = [x[:, None] for x in (self.g, self.w0)]
+        g, w0 = self._cols.g, self._cols.w0
 
         # If requested, Rayleigh contribution is coupled to the aerosols.
         if coupling:
@@ -507,11 +594,23 @@ class Atmosphere(namedtuple("Atmosphere", ATTRS)):
         ak = np.sqrt((1. - w0) * (1. - w0 * g))
         r0 = (ak - 1. + w0) / (ak + 1. - w0)
 
-        # Compute direct, global and diffuse transmittances.
-        tdir = np.exp(-1.0 * tau / mu0)
-        tdir_k = tdir**ak
-        tglb = (1. - r0**2) * tdir_k / (1. - (r0 * tdir_k)**2)
-        tdif = tglb - tdir
+        # Compute direct, global and diffuse transmittances. The expressions
+        # are evaluated in place on a single array, and the diffuse array is
+        # used as scratch space for the denominator before holding its final
+        # values. The power of the direct transmittance is computed from the
+        # same exponent as the direct transmittance, which avoids a generic
+        # power.
+        tglb, tdir, tdif = np.empty((3,) + np.broadcast(tau, mu0, ak).shape)
+        np.multiply(tau, -1. / mu0, out=tdir)
+        np.multiply(tdir, ak, out=tglb)
+        np.exp(tdir, out=tdir)
+        np.exp(tglb, out=tglb)
+        np.multiply(r0, tglb, out=tdif)
+        np.square(tdif, out=tdif)
+        np.subtract(1., tdif, out=tdif)
+        tglb *= 1. - r0 * r0
+        tglb /= tdif
+        np.subtract(tglb, tdir, out=tdif)
 
         out = (tglb, tdir, tdif) + salb
         return out
@@ -586,22 +685,24 @@ class Atmosphere(namedtuple("Atmosphere", ATTRS)):
             args = [wvln_um, mu0, return_albedo]
             # Compute Rayleigh transmittances.
             out = self.trn_rayleigh(*args)
-            tglb_ray, tdir_ray, _tdif_ray = out[:3]
+            tglb_ray, tdir_ray, tdif_ray = out[:3]
             sray = out[3] if return_albedo else ()
             # Compute aerosol transmittances.
             out = self.trn_aerosols(*args)
             tglb_aer, tdir_aer, _tdif_aer = out[:3]
             saer = out[3] if return_albedo else ()
             # Compute mix transmittances without Rayleigh-aerosol coupling.
-            tglb = tglb_ray * tglb_aer
-            tdir = tdir_ray * tdir_aer
-            tdif = tglb - tdir
-            salb = (sray + saer,) if return_albedo else ()
+            # The Rayleigh arrays are not used anywhere else, so that they
+            # are updated in place instead of allocating new arrays.
+            tglb = np.multiply(tglb_ray, tglb_aer, out=tglb_ray)
+            tdir = np.multiply(tdir_ray, tdir_aer, out=tdir_ray)
+            tdif = np.subtract(tglb, tdir, out=tdif_ray)
+            salb = (np.add(sray, saer, out=sray),) if return_albedo else ()
 
         out = (tglb, tdir, tdif) + salb
         return out
 
-    def trn_water(self, wvln, mu0):
+    def trn_water(self, wvln, mu0, out=None):
         r"""Return the transmittance due to water vapour absorption.
 
         The transmittance is computed by using the formula:
@@ -627,6 +728,10 @@ class Atmosphere(namedtuple("Atmosphere", ATTRS)):
         mu0 : array-like
             cosines of the solar zenith angle, with shape ``(nscen,)``
 
+        out : array-like, optional
+            array with shape ``(nscen, nwvln)`` where the transmittance is
+            stored; if not given, a new array is allocated
+
         Returns
         -------
 
@@ -638,7 +743,8 @@ class Atmosphere(namedtuple("Atmosphere", ATTRS)):
         ------
 
         ValueError
-            if ``wvln`` or ``mu0`` have invalid shapes
+            if ``wvln`` or ``mu0`` have invalid shapes, or if ``out`` is
+            not a float array with shape ``(nscen, nwvln)``
 
         IndexError
             if the shape of ``mu0`` does not match to the number of
@@ -649,24 +755,15 @@ class Atmosphere(namedtuple("Atmosphere", ATTRS)):
         if np.ndim(wvln) > 1:
             raise ValueError("'wvln' must be 0- or 1-dimensional")
         wvln = np.atleast_1d(wvln)
-        if np.ndim(mu0) > 1:
-            raise ValueError("'mu0' must be 0- or 1-dimensional")
-        mu0 = np.atleast_1d(mu0)[:, None]
-        if self.nscen != 1 and mu0.shape[0] not in [1, self.nscen]:
-            msg = "mismatch in shapes of 'mu0' and the Atmosphere instance"
-            raise IndexError(msg)
-
-        # Compute the absorption coefficients and exponents for water vapour
-        # at the given input wavelengths by using linear interpolation.
-        water_coef = np.interp(wvln, *self.abscoef[[0, 1]])
-        water_exp = np.interp(wvln, *self.abscoef[[0, 2]])
-        water_path = self.h2o[:, None]
+        mu0 = self._mu0_column(mu0)
 
-        trn = np.where(np.isclose(water_exp, 0.0), 1.0,
-                       np.exp(-(water_coef * water_path / mu0)**water_exp))
-        return trn
+        # The transmittance is 1 wherever the exponent is null, so that the
+        # absorption term is only computed for the wavelengths with actual
+        # water vapour absorption.
+        active, tau = _water_tau(wvln, self._cols.h2o / mu0)
+        return _trn_masked(active, tau, out=out)
 
-    def trn_ozone(self, wvln, mu0):
+    def trn_ozone(self, wvln, mu0, out=None):
         r"""Return the transmittance due to ozone absorption.
 
         The transmittance is computed by using the formula:
@@ -690,6 +787,10 @@ class Atmosphere(namedtuple("Atmosphere", ATTRS)):
         mu0 : array-like
             cosines of the solar zenith angle, with shape ``(nscen,)``
 
+        out : array-like, optional
+            array with shape ``(nscen, nwvln)`` where the transmittance is
+            stored; if not given, a new array is allocated
+
         Returns
         -------
 
@@ -701,7 +802,8 @@ class Atmosphere(namedtuple("Atmosphere", ATTRS)):
         ------
 
         ValueError
-            if the input ``wvln`` does not have a proper shape
+            if the input ``wvln`` does not have a proper shape, or if
+            ``out`` is not a float array with shape ``(nscen, nwvln)``
 
         IndexError
             if the shape of ``mu0`` does not match to the number of
@@ -712,26 +814,24 @@ class Atmosphere(namedtuple("Atmosphere", ATTRS)):
         if np.ndim(wvln) > 1:
             raise ValueError("'wvln' must be 0- or 1-dimensional")
         wvln = np.atleast_1d(wvln)
-        if np.ndim(mu0) > 1:
-            raise ValueError("'mu0' must be 0- or 1-dimensional")
-        mu0 = np.atleast_1d(mu0)[:, None]
-        if self.nscen != 1 and mu0.shape[0] not in [1, self.nscen]:
-            msg = "mismatch in shapes of 'mu0' and the Atmosphere instance"
-            raise IndexError(msg)
+        mu0 = self._mu0_column(mu0)
 
         # Compute the absorption cross sections for ozone at the given input
         # wavelengths by using linear interpolation, and convert them to
         # absorption coefficients in cm-1 by using Loschmidt's number.
-        ozone_xsec = np.interp(wvln, *self.abscoef[[0, 3]])
-        ozone_coef = 2.687E19 * ozone_xsec
+        ozone_coef = _ozone_coef(wvln)
 
         # Convert from ozone amount in DU to ozone absorption path in cm.
-        ozone_path = (1E-3 * self.o3)[:, None]
+        ozone_path = 1E-3 * self._cols.o3
 
-        trn = np.exp(-ozone_coef * ozone_path / mu0)
+        # Combine the small per-scenario factors first, so that the only
+        # full-size array is created once and then updated in place.
+        _check_out(out, (np.broadcast(ozone_path, mu0).shape[0], wvln.size))
+        trn = np.multiply(ozone_coef, -ozone_path / mu0, out=out)
+        np.exp(trn, out=trn)
         return trn
 
-    def trn_oxygen(self, wvln, mu0):
+    def trn_oxygen(self, wvln, mu0, out=None):
         r"""Return the transmittance due to molecular oxygen absorption.
 
         The transmittance is computed by using the formula:
@@ -756,6 +856,10 @@ class Atmosphere(namedtuple("Atmosphere", ATTRS)):
         mu0 : array-like
             cosines of the solar zenith angle, with shape ``(nscen,)``
 
+        out : array-like, optional
+            array with shape ``(nscen, nwvln)`` where the transmittance is
+            stored; if not given, a new array is allocated
+
         Returns
         -------
 
@@ -767,29 +871,88 @@ class Atmosphere(namedtuple("Atmosphere", ATTRS)):
         ------
 
         ValueError
-            if ``wvln`` or ``mu0`` have invalid shapes
+            if ``wvln`` or ``mu0`` have invalid shapes, or if ``out`` is
+            not a float array with shape ``(nscen, nwvln)``
         """
 
         # Ensure shape of the input arguments.
         if np.ndim(wvln) > 1:
             raise ValueError("'wvln' must be 0- or 1-dimensional")
         wvln = np.atleast_1d(wvln)
-        if np.ndim(mu0) > 1:
-            raise ValueError("'mu0' must be 0- or 1-dimensional")
-        mu0 = np.atleast_1d(mu0)[:, None]
-        if self.nscen != 1 and mu0.shape[0] not in [1, self.nscen]:
-            msg = "mismatch in shapes of 'mu0' and the Atmosphere instance"
-            raise IndexError(msg)
+        mu0 = self._mu0_column(mu0)
+
+        # The transmittance is 1 wherever the coefficient is null, so that
+        # the absorption term is only computed for the wavelengths with
+        # actual oxygen absorption.
+        active, tau = _oxygen_tau(wvln, mu0)
+        return _trn_masked(active, tau, out=out)
+
+    def trn_gas(self, wvln, mu0, out=None):
+        r"""Return the transmittance due to gas absorption.
+
+        The transmittance is the product of the transmittances due to
+        water vapour, ozone and molecular oxygen absorption:
+
+        .. math::
+            T_\text{gas}(\lambda) =
+                T_\text{H2O}(\lambda) \times T_\text{O3}(\lambda)
+                \times T_\text{O2}(\lambda),
+
+        which is computed as a single exponential of the sum of the
+        absorption terms of the three gases.
+
+        Parameters
+        ----------
+
+        wvln : array-like
+            wavelengths in nanometers, with shape ``(nwvln,)``
+
+        mu0 : array-like
+            cosines of the solar zenith angle, with shape ``(nscen,)``
 
-        # Compute the absorption coefficients for oxygen at the given input
-        # wavelengths by using linear interpolation.
-        oxygen_coef = np.interp(wvln, *self.abscoef[[0, 4]])
+        out : array-like, optional
+            array with shape ``(nscen, nwvln)`` where the transmittance is
+            stored; if not given, a new array is allocated
 
-        # Declare the oxygen path and the oxygen exponent as constants.
-        oxygen_path = np.array([0.209 * 173200])[:, None]
-        oxygen_exp = 0.5641
+        Returns
+        -------
 
-        trn = np.exp(-(oxygen_coef * oxygen_path / mu0)**oxygen_exp)
+        trn : array-like
+            gas transmittance, with shape ``(nscen, nwvln)``,
+            for every scenario and wavelength
+
+        Raises
+        ------
+
+        ValueError
+            if ``wvln`` or ``mu0`` have invalid shapes, or if ``out`` is
+            not a float array with shape ``(nscen, nwvln)``
+
+        IndexError
+            if the shape of ``mu0`` does not match to the number of
+            scenarios in the :class:`Atmosphere` instance
+        """
+
+        # Ensure shape of the input arguments.
+        if np.ndim(wvln) > 1:
+            raise ValueError("'wvln' must be 0- or 1-dimensional")
+        wvln = np.atleast_1d(wvln)
+        mu0 = self._mu0_column(mu0)
+
+        # Start from the ozone absorption term, whose array stores the sum
+        # of all the absorption terms before taking the exponential.
+        ozone_path = 1E-3 * self._cols.o3
+        _check_out(out, (np.broadcast(ozone_path, mu0).shape[0], wvln.size))
+        trn = np.multiply(_ozone_coef(wvln), -ozone_path / mu0, out=out)
+
+        # Add the oxygen and water vapour absorption terms only for the
+        # wavelengths where each gas absorbs.
+        active, tau = _oxygen_tau(wvln, mu0)
+        trn[:, active] -= tau
+        active, tau = _water_tau(wvln, self._cols.h2o / mu0)
+        trn[:, active] -= tau
+
+        np.exp(trn, out=trn)
         return trn
 
     @staticmethod
@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2017-2019, 2023 Víctor Molina García
+#
+# This file is part of solo.
+#
+# solo is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# solo is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with solo; if not, see <https://www.gnu.org/licenses/>.
+#
+"""Wavelength-dependent helpers for the :class:`Atmosphere` class."""
+
+from __future__ import division
+import functools
+import os.path
+import numpy as np
+
+
+# Load the array of molecular absorption coefficients in read-only mode.
+# It is read from the binary copy of the text file, which is generated with
+# `tools/build_data.py` and stores the array transposed and in C order, so
+# that every row is a contiguous view.
+DIRFOLD = os.path.dirname(os.path.abspath(__file__))
+ABSCOEF_PATH = os.path.join(os.path.dirname(DIRFOLD), "dat", "abscoef.dat")
+ABSCOEF_NPY_PATH = os.path.splitext(ABSCOEF_PATH)[0] + ".npy"
+ABSCOEF = np.load(ABSCOEF_NPY_PATH)
+ABSCOEF.flags.writeable = False
+
+# Define read-only views for the rows of the absorption coefficients array.
+ABSCOEF_WVLN = ABSCOEF[0]
+ABSCOEF_H2O = ABSCOEF[1]
+ABSCOEF_H2O_EXP = ABSCOEF[2]
+ABSCOEF_O3 = ABSCOEF[3]
+ABSCOEF_O2 = ABSCOEF[4]
+
+
+def _interp_abscoef(wvln, coef):
+    """Return absorption coefficients `coef` interpolated at `wvln`."""
+
+    return np.interp(wvln, ABSCOEF_WVLN, coef)
+
+
+# Maximum number of wavelength grids remembered by the memoized helpers.
+CACHE_MAXSIZE = 32
+
+
+def _memoize_wvln(func):
+    """Decorator to memoize a function of an array of wavelengths.
+
+    The results are stored in read-only mode and keyed by the type, shape
+    and bytes of the input wavelengths, since arrays are not hashable.
+    """
+
+    cache = {}
+
+    @functools.wraps(func)
+    def wrapper(wvln):
+        wvln = np.ascontiguousarray(wvln)
+        key = (wvln.dtype.str, wvln.shape, wvln.tobytes())
+        try:
+            return cache[key]
+        except KeyError:
+            pass
+        out = func(wvln)
+        out.flags.writeable = False
+        if len(cache) >= CACHE_MAXSIZE:
+            cache.clear()
+        cache[key] = out
+        return out
+
+    wrapper.cache = cache
+    return wrapper
+
+
+@_memoize_wvln
+def _water_logcoef(wvln):
+    """Return the water vapour absorption log-coefficients and exponents.
+
+    The returned array has shape ``(2, nwvln)``, where the first row
+    stores the natural logarithms of the absorption coefficients in cm-1
+    at `wvln` and the second row stores the empirical exponents, which
+    are set to exactly zero where they are negligible.
+    """
+
+    coef = _interp_abscoef(wvln, ABSCOEF_H2O)
+    coef_exp = _interp_abscoef(wvln, ABSCOEF_H2O_EXP)
+    coef_exp[np.isclose(coef_exp, 0.0)] = 0.0
+    with np.errstate(divide="ignore"):
+        logcoef = np.log(coef)
+    return np.array([logcoef, coef_exp])
+
+
+@_memoize_wvln
+def _ozone_coef(wvln):
+    """Return the ozone absorption coefficients in cm-1 at `wvln`."""
+
+    # Convert the interpolated absorption cross sections into absorption
+    # coefficients by using Loschmidt's number.
+    return 2.687E19 * _interp_abscoef(wvln, ABSCOEF_O3)
+
+
+# Define the oxygen absorption path in cm and the oxygen empirical exponent,
+# together with the path already raised to the exponent.
+OXYGEN_PATH = 0.209 * 173200
+OXYGEN_EXP = 0.5641
+OXYGEN_PATH_POW = OXYGEN_PATH**OXYGEN_EXP
+
+
+@_memoize_wvln
+def _oxygen_coef_pow(wvln):
+    """Return the oxygen absorption coefficients in cm-1 at `wvln`.
+
+    The coefficients are returned already raised to the oxygen empirical
+    exponent, which is the only way in which they are used.
+    """
+
+    return _interp_abscoef(wvln, ABSCOEF_O2)**OXYGEN_EXP
+
+
+def _water_tau(wvln, water_path):
+    """Return the water vapour absorption term where water vapour absorbs.
+
+    The term is only computed for the wavelengths with a non-null exponent,
+    which are returned as a boolean mask of shape ``(nwvln,)`` together
+    with the term itself. The water vapour path `water_path` is a column
+    array already divided by the cosine of the solar zenith angle.
+    """
+
+    # The coefficients are given as logarithms, so that the power can be
+    # evaluated as an exponential of the sum of the logarithms of the
+    # coefficients and the water vapour path, which are only computed
+    # per wavelength and per scenario, respectively.
+    water_logcoef, water_exp = _water_logcoef(wvln)
+    with np.errstate(divide="ignore"):
+        water_logpath = np.log(water_path)
+    active = water_exp != 0
+    tau = np.add(water_logcoef[active], water_logpath)
+    tau *= water_exp[active]
+    np.exp(tau, out=tau)
+    return active, tau
+
+
+def _oxygen_tau(wvln, mu0):
+    """Return the oxygen absorption term where oxygen absorbs.
+
+    The term is only computed for the wavelengths with a non-null
+    coefficient, which are returned as a boolean mask of shape
+    ``(nwvln,)`` together with the term itself. This also keeps the other
+    wavelengths free of NaN when `mu0` is negative, where the power of
+    `mu0` is not defined.
+    """
+
+    # The exponent is distributed over the factors of the absorption term,
+    # so that the oxygen path is a precomputed constant.
+    oxygen_coef_pow = _oxygen_coef_pow(wvln)
+    active = oxygen_coef_pow != 0
+    oxygen_path_pow = OXYGEN_PATH_POW * mu0**-OXYGEN_EXP
+    tau = np.multiply(oxygen_coef_pow[active], oxygen_path_pow)
+    return active, tau
+
+
+@_memoize_wvln
+def _rayleigh_tau0(wvln_um):
+    """Return the Rayleigh optical depth at 1 atm for `wvln_um` in microns."""
+
+    # Define the coefficients used in Bates' formula.
+    c = [117.2594, -1.3215, 0.000320, -0.000076]
+
+    # The denominator is evaluated with Horner's scheme on the squared
+    # wavelength, so that no generic power call is needed.
+    wvln_um2 = wvln_um * wvln_um
+    inv_wvln_um2 = 1. / wvln_um2
+    div = ((c[0] * wvln_um2 + c[1]) * wvln_um2 + c[2]
+           + c[3] * inv_wvln_um2 * inv_wvln_um2)
+    return 1. / div
@@ -27,6 +27,16 @@ import os.path
 import numpy as np
 
 
+# Load the array of TOA irradiances in read-only mode. It is read from the
+# binary copy of the text file, which is generated with `tools/build_data.py`
+# and stores the wavelengths and the irradiances as its two rows.
+DIRFOLD = os.path.dirname(os.path.abspath(__file__))
+KURUCZ_PATH = os.path.join(DIRFOLD, "dat", "kurucz.dat")
+KURUCZ_NPY_PATH = os.path.splitext(KURUCZ_PATH)[0] + ".npy"
+KURUCZ = np.load(KURUCZ_NPY_PATH)
+KURUCZ.flags.writeable = False
+
+
 def radtran(geo, atm, wvln=None, coupling=True):
     """Return the BOA irradiances based on an atmosphere and geometry.
 
@@ -74,41 +84,50 @@ def radtran(geo, atm, wvln=None, coupling=True):
         if ``coupling`` is not a boolean flag
     """
 
-    # Read the TOA irradiance as a function of the wavelength.
-    path = os.path.join(os.path.dirname(__file__), "dat", "kurucz.dat")
-    wvln0, irr0 = np.loadtxt(path).T
+    # Get the TOA irradiance as a function of the wavelength.
+    wvln0, irr0 = KURUCZ
 
     # Ensure consistency of the input arguments.
     wvln = np.atleast_1d(wvln0 if wvln is None else wvln)
     if np.ndim(wvln) > 1:
         raise ValueError("'wvln' must be 0- or 1-dimensional")
 
+    # Get the cosines of the solar zenith angle and the geometric factor
+    # only once, since they are needed along the whole computation.
+    mu0 = geo.mu0
+    mu0_col = mu0[:, None]
+    geo_factor = geo.geometric_factor()[:, None]
+
     # Convert wavelengths from nanometers to microns and adjust the TOA
     # irradiance to the actual Sun-Earth distance.
     wvln_um = 1E-3 * wvln
-    irr0 = irr0 * geo.geometric_factor()[:, None]
+    irr0 = irr0 * geo_factor
 
     # Compute the transmittance due to Rayleigh and aerosols.
-    args = [wvln_um, geo.mu0, True, coupling]
-    tglb_mix, tdir_mix, _tdif_mix, atm_alb = atm.trn_mixture(*args)
+    args = [wvln_um, mu0, True, coupling]
+    tglb_mix, tdir_mix, tdif_mix, atm_alb = atm.trn_mixture(*args)
 
     # Compute the transmittance due to gas absorption.
-    args = [wvln, geo.mu0]
-    tdir_wat = atm.trn_water(*args)
-    tdir_ozo = atm.trn_ozone(*args)
-    tdir_oxy = atm.trn_oxygen(*args)
-    tdir_gas = tdir_wat * tdir_ozo * tdir_oxy
-
-    # Compute the amplification factor for the BOA global irradiance.
-    amp_factor = 1. / (1. - atm.rho[:, None] * atm_alb)
-
-    # Compute the BOA global, direct and diffuse irradiances.
-    mu0 = geo.mu0[:, None]
-    irr_glb = irr0 * mu0 * tglb_mix * tdir_gas * amp_factor
-    irr_dir = irr0 * tdir_mix * tdir_gas
-    irr_dif = irr_glb - irr_dir * mu0
-
-    # If requested, squeeze the length-1 axes from the output arrays.
+    tdir_gas = atm.trn_gas(wvln, mu0)
+
+    # Compute the denominator of the amplification factor for the BOA
+    # global irradiance, which is applied later as a division instead of
+    # taking its reciprocal. The atmospheric albedo is not needed
+    # afterwards, so that its array is reused to store the denominator.
+    amp_denom = np.multiply(atm.rho[:, None], atm_alb, out=atm_alb)
+    np.subtract(1., amp_denom, out=amp_denom)
+
+    # Compute the BOA global, direct and diffuse irradiances. The mixture
+    # transmittances are not needed afterwards, so that their arrays are
+    # reused to store the irradiances instead of allocating temporaries.
+    irr_dir = np.multiply(tdir_mix, tdir_gas, out=tdir_mix)
+    irr_dir *= irr0
+    irr_glb = np.multiply(tglb_mix, tdir_gas, out=tglb_mix)
+    irr_glb /= amp_denom
+    irr_glb *= irr0 * mu0_col
+    irr_dif = np.multiply(irr_dir, mu0_col, out=tdif_mix)
+    np.subtract(irr_glb, irr_dif, out=irr_dif)
+
     out = (irr_glb, irr_dir, irr_dif)
     return out
 
@@ -30,66 +30,104 @@ from solo.api import Geometry
 from solo.api import Atmosphere
 
 
-class TestSolo(unittest.TestCase):
-    """Template class for :mod:`solo` test cases."""
-
-    @staticmethod
-    def one():
-        """Return the one-tuple."""
+# Define the inputs for the vectorised Geometry and Atmosphere instances,
+# whose first items must match the scalar reference instances.
+GEO1_LAT = np.array([28.31, 35.45, 40.13])
+GEO1_LON = np.array([-16.50, 25.80, -9.51])
+GEO1_SZA = np.array([60.0, 15.50, 30.50])
+GEO1_DAY = np.array([152, 12, 250])
+ATM1_P = np.array([800.0, 875.4, 925.3])
+ATM1_RHO = np.array([0.2, 0.35, 0.7])
+ATM1_O3 = np.array([300.0, 286.0, 310.0])
+ATM1_H2O = np.array([0.4, 0.15, 0.01])
+ATM1_ALPHA = np.array([1.5, 0.75, 0.9])
+ATM1_BETA = np.array([0.05, 0.10, 0.15])
+for _item in (GEO1_LAT, GEO1_LON, GEO1_SZA, GEO1_DAY, ATM1_P, ATM1_RHO,
+              ATM1_O3, ATM1_H2O, ATM1_ALPHA, ATM1_BETA):
+    _item.flags.writeable = False
 
-        return (1,)
+# Cache for the reference data file, which is shared by all the tests.
+_CACHE = {}
 
-    def setUp(self):
-        """Set up the attributes needed for the test."""
 
-        self.delta = 5E-4
+def _load_transmittance():
+    """Return the reference transmittance data as a read-only array."""
 
-        # Read the file with reference data.
+    if "transmittance" not in _CACHE:
         here = os.path.dirname(__file__)
         path = os.path.join(here, "dat", "transmittance.dat")
         data = np.loadtxt(path).T
+        data.flags.writeable = False
+        _CACHE["transmittance"] = data
+    return _CACHE["transmittance"]
+
+
+def _freeze(obj):
+    """Set the array attributes of an instance in read-only mode.
+
+    The arrays that the attributes are views of are also frozen, as well as
+    the hidden column views of :class:`Atmosphere` instances, since views
+    created before freezing their base array are still writeable.
+    """
+
+    for item in tuple(obj) + tuple(getattr(obj, "_cols", ())):
+        while isinstance(item, np.ndarray):
+            item.flags.writeable = False
+            item = item.base
+    return obj
+
+
+class TestSolo(unittest.TestCase):  # pylint: disable=too-many-instance-attributes
+    """Template class for :mod:`solo` test cases."""
+
+    # One-tuple used to build the expected shapes of the results.
+    ONE = (1,)
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up the class-level fixtures shared by the tests."""
+
+        cls.delta = 5E-4
+
+        # Read the file with reference data.
+        data = _load_transmittance()
 
         # Extract the set of wavelengths in nanometers and microns.
-        self.wvln = data[0]
-        self.wvln_um = 0.001 * self.wvln
+        cls.wvln = data[0]
+        cls.wvln_um = 0.001 * cls.wvln
+        cls.wvln_um.flags.writeable = False
 
         # Create the instances of Geometry and Atmosphere.
-        self.geo0 = Geometry(
-            lat=28.31, lon=-16.50, sza=60, day=152)
-        self.atm0 = Atmosphere(
-            p=800, rho=0.2, o3=300, h2o=0.4, alpha=1.5, beta=0.05)
+        # The instances are shared by all the tests, so that their arrays
+        # are set in read-only mode.
+        cls.geo0 = _freeze(Geometry(
+            lat=28.31, lon=-16.50, sza=60, day=152))
+        cls.atm0 = _freeze(Atmosphere(
+            p=800, rho=0.2, o3=300, h2o=0.4, alpha=1.5, beta=0.05))
 
         # Create vectorised instances of Geometry and Atmosphere.
-        self.geo1 = Geometry(
-            lat=np.asarray([np.degrees(self.geo0.lat[0]), 35.45, 40.13]),
-            lon=np.asarray([np.degrees(self.geo0.lon[0]), 25.80, -9.51]),
-            sza=np.asarray([np.degrees(self.geo0.sza[0]), 15.50, 30.50]),
-            day=np.asarray([self.geo0.day[0], 12, 250]))
-        self.atm1 = Atmosphere(
-            p=np.asarray([self.atm0.p[0], 875.4, 925.3]),
-            rho=np.asarray([self.atm0.rho[0], 0.35, 0.7]),
-            o3=np.asarray([self.atm0.o3[0], 286., 310]),
-            h2o=np.asarray([self.atm0.h2o[0], 0.15, 0.01]),
-            alpha=np.asarray([self.atm0.alpha[0], 0.75, 0.9]),
-            beta=np.asarray([self.atm0.beta[0], 0.10, 0.15]))
+        cls.geo1 = _freeze(Geometry(
+            lat=GEO1_LAT, lon=GEO1_LON, sza=GEO1_SZA, day=GEO1_DAY))
+        cls.atm1 = _freeze(Atmosphere(
+            p=ATM1_P, rho=ATM1_RHO, o3=ATM1_O3, h2o=ATM1_H2O,
+            alpha=ATM1_ALPHA, beta=ATM1_BETA))
 
         # Store the results corresponding to the created instances.
-        self.result = {
-            "tau_ray": data[1],
-            "tau_aer": data[2],
-            "tdir_gas": data[4],
-            "tdir_mix": data[5],
-            "tglb_mix": data[6],
-            "tdif_mix": data[7],
-        }
-
-    def tearDown(self):
-        """Clean the attributes needed for the tests."""
-
-        self.wvln = None
-        self.wvln_um = None
-        self.geo0 = None
-        self.atm0 = None
-        self.geo1 = None
-        self.atm1 = None
-        self.result = None
+        cls.tau_ray = data[1]
+        cls.tau_aer = data[2]
+        cls.tdir_gas = data[4]
+        cls.tdir_mix = data[5]
+        cls.tglb_mix = data[6]
+        cls.tdif_mix = data[7]
+
+    def check_reference(self, obj1, obj0, wvln, shp1):
+        """Check the shape of a result and its first row against `obj0`.
+
+        The first row is always the reference scenario, which is checked
+        against one or all the reference wavelengths depending on `wvln`.
+        """
+
+        ref0 = obj0 if np.ndim(wvln) else obj0[0]
+        flag = np.allclose(obj1[0], ref0, self.delta)
+        self.assertTupleEqual(obj1.shape, shp1)
+        self.assertTrue(flag)
@@ -19,6 +19,8 @@
 #
 """Basic tests for the :class:`Atmosphere` class."""
 
+import copy
+import pickle
 import os.path
 try:
     import unittest2 as unittest
@@ -27,11 +29,24 @@ except ImportError:
 
 import numpy as np
 from solo.api import Atmosphere
+from solo.api.Atmosphere import ABSCOEF_PATH
 from . import TestSolo
 
 
 UNITTEST_FOLDER = os.path.dirname(__file__)
 ATMOSPHERE_FOLDER = os.path.join(UNITTEST_FOLDER, "obj", "atm")
+ATMOSPHERE_CACHE = {}
+
+
+def load_atmosphere(name):
+    """Return the :class:`Atmosphere` stored in a test file, parsing it once."""
+
+    try:
+        atm = ATMOSPHERE_CACHE[name]
+    except KeyError:
+        path = os.path.join(ATMOSPHERE_FOLDER, name)
+        atm = ATMOSPHERE_CACHE[name] = Atmosphere.from_file(path)
+    return atm
 
 
 class TestAtmosphere(TestSolo):
@@ -49,11 +64,164 @@ class TestAtmosphere(TestSolo):
         self.assertTrue(np.allclose(atm1.w0, atm2.w0))
         self.assertTrue(np.allclose(atm1.g, atm2.g))
 
+    def test_init_error(self):
+        """Test :class:`Atmosphere` creation with invalid arguments."""
+
+        base = dict(p=800, rho=0.2, o3=300, h2o=0.4, alpha=1.5, beta=0.05)
+        cases = [
+            ("invalid_p_too_low", dict(p=-1)),
+            ("invalid_rho_too_low", dict(rho=-0.1)),
+            ("invalid_rho_too_big", dict(rho=1.1)),
+            ("invalid_o3_too_low", dict(o3=-1)),
+            ("invalid_h2o_too_low", dict(h2o=-0.1)),
+            ("invalid_alpha_too_low", dict(alpha=-0.1)),
+            ("invalid_beta_too_low", dict(beta=-0.1)),
+            ("invalid_w0_too_low", dict(w0=-0.1)),
+            ("invalid_w0_too_big", dict(w0=1.1)),
+            ("invalid_g_too_low", dict(g=-1.1)),
+            ("invalid_g_too_big", dict(g=1.1)),
+            ("invalid_one_scenario",
+             dict(p=[800, -1], rho=[0.2, 0.2], o3=[300, 300], h2o=[0.4, 0.4],
+                  alpha=[1.5, 1.5], beta=[0.05, 0.05])),
+            ("invalid_one_scenario_after_nan",
+             dict(p=[np.nan, -1], rho=[0.2, 0.2], o3=[300, 300],
+                  h2o=[0.4, 0.4], alpha=[1.5, 1.5], beta=[0.05, 0.05])),
+        ]
+
+        for name, kwds in cases:
+            with self.subTest(case=name):
+                args = base.copy()
+                args.update(kwds)
+                self.assertRaises(ValueError, Atmosphere, **args)
+
+    def test_init_type_error(self):
+        """Test :class:`Atmosphere` creation with non-numeric arguments."""
+
+        base = dict(p=800, rho=0.2, o3=300, h2o=0.4, alpha=1.5, beta=0.05)
+        cases = [
+            ("invalid_p_str", dict(p="800")),
+            ("invalid_g_str", dict(g="0.85")),
+            ("invalid_all_str_arrays",
+             dict(p=["800"], rho=["0.2"], o3=["300"], h2o=["0.4"],
+                  alpha=["1.5"], beta=["0.05"])),
+        ]
+
+        for name, kwds in cases:
+            with self.subTest(case=name):
+                args = base.copy()
+                args.update(kwds)
+                self.assertRaises(TypeError, Atmosphere, **args)
+
+    def test_init_attributes(self):
+        """Test the storage of the :class:`Atmosphere` attributes."""
+
+        pres = np.array([800, 875, 880])
+        atm = Atmosphere(
+            p=pres, rho=0.2 * np.ones(3), o3=300 * np.ones(3),
+            h2o=0.4 * np.ones(3), alpha=1.5 * np.ones(3),
+            beta=0.05 * np.ones(3))
+        for value in atm:
+            self.assertEqual(value.dtype, np.dtype(float))
+            self.assertTupleEqual(value.shape, (atm.nscen,))
+        # Modifying the input arrays must not modify the instance.
+        pres[0] = 0
+        self.assertEqual(atm.p[0], 800)
+
+    def test_init_scalar(self):
+        """Test :class:`Atmosphere` creation from scalar arguments."""
+
+        kwds = dict(p=800, rho=0.2, o3=300, h2o=0.4, alpha=1.5, beta=0.05)
+        atm1 = Atmosphere(**kwds)
+        atm2 = Atmosphere(
+            **dict((key, np.array(val)) for key, val in kwds.items()))
+        for value1, value2 in zip(atm1, atm2):
+            self.assertEqual(value1.dtype, np.dtype(float))
+            self.assertTupleEqual(value1.shape, (1,))
+            self.assertTrue(np.array_equal(value1, value2))
+
+    def test_init_scalar_special(self):
+        """Test :class:`Atmosphere` creation from NaN and bool scalars."""
+
+        base = dict(p=800, rho=0.2, o3=300, h2o=0.4, alpha=1.5, beta=0.05)
+        cases = [
+            ("nan_p", dict(p=np.nan)),
+            ("nan_g", dict(g=np.nan)),
+            ("bool_rho", dict(rho=True)),
+            ("bool_beta", dict(beta=False)),
+        ]
+
+        # Scalars must be stored as their 0-dimensional array counterparts.
+        for name, kwds in cases:
+            with self.subTest(case=name):
+                args1 = base.copy()
+                args1.update(kwds)
+                args2 = dict((key, np.array(val)) for key, val in args1.items())
+                atm1 = Atmosphere(**args1)
+                atm2 = Atmosphere(**args2)
+                for value1, value2 in zip(atm1, atm2):
+                    self.assertEqual(value1.dtype, np.dtype(float))
+                    self.assertTrue(np.array_equal(value1, value2) or
+                                    np.isnan(value1) and np.isnan(value2))
+
+    def test_replace(self):
+        """Test the validation of :meth:`Atmosphere._replace`."""
+
+        atm1 = Atmosphere(
+            p=800, rho=0.2, o3=300, h2o=0.4, alpha=1.5, beta=0.05)
+        atm2 = atm1._replace(p=[900])
+        self.assertEqual(atm2.p[0], 900)
+        self.assertEqual(atm2.tau_rayleigh(0.5).shape, (1, 1))
+        self.assertRaises(ValueError, atm1._replace, rho=[2])
+
+    def test_copy_pickle(self):
+        """Test copying and pickling of :class:`Atmosphere` instances."""
+
+        cases = [
+            ("copy", copy.copy),
+            ("deepcopy", copy.deepcopy),
+            ("pickle", lambda obj: pickle.loads(pickle.dumps(obj))),
+        ]
+
+        for name, func in cases:
+            with self.subTest(case=name):
+                atm1 = Atmosphere(
+                    p=[800, 900], rho=[0.2, 0.2], o3=[300, 300],
+                    h2o=[0.4, 0.4], alpha=[1.5, 1.5], beta=[0.05, 0.05])
+                atm2 = func(atm1)
+                for value1, value2 in zip(atm1, atm2):
+                    self.assertTrue(np.array_equal(value1, value2))
+                # The new instance must not share memory with the original,
+                # and its methods must use its own attributes.
+                atm2.p[...] = 1000
+                self.assertTrue(np.array_equal(atm1.p, [800, 900]))
+                obj0 = Atmosphere(*atm2).tau_rayleigh(0.5)
+                obj1 = atm2.tau_rayleigh(0.5)
+                self.assertTrue(np.array_equal(obj1, obj0))
+
+    def test_shared_read_only(self):
+        """Test that the shared :class:`Atmosphere` fixtures are read-only."""
+
+        for name in ["atm0", "atm1"]:
+            atm = getattr(self, name)
+            cols = atm._cols  # pylint: disable=protected-access
+            for item in tuple(atm) + tuple(cols) + (atm.p.base,):
+                with self.subTest(atm=name):
+                    with self.assertRaises(ValueError):
+                        item[...] = 0
+
+    def test_abscoef(self):
+        """Test the binary copy of the absorption coefficients file."""
+
+        obj0 = np.loadtxt(ABSCOEF_PATH, usecols=(0, 1, 2, 3, 4)).T
+        obj1 = self.atm0.abscoef
+        self.assertTrue(np.array_equal(obj1, obj0))
+        self.assertTrue(obj1.flags.c_contiguous)
+        self.assertFalse(obj1.flags.writeable)
+
     def test_atm11(self):
         """Test loading of `atm11.dat` from file."""
 
-        path = os.path.join(ATMOSPHERE_FOLDER, "atm11.dat")
-        atm1 = Atmosphere.from_file(path)
+        atm1 = load_atmosphere("atm11.dat")
         atm2 = Atmosphere(
             p=800, rho=0.2, o3=300, h2o=0.4, alpha=1.5, beta=0.05,
             w0=0.9, g=0.85)
@@ -62,8 +230,7 @@ class TestAtmosphere(TestSolo):
     def test_atm12(self):
         """Test loading of `atm12.dat` from file."""
 
-        path = os.path.join(ATMOSPHERE_FOLDER, "atm12.dat")
-        atm1 = Atmosphere.from_file(path)
+        atm1 = load_atmosphere("atm12.dat")
         atm2 = Atmosphere(
             p=800, rho=0.2, o3=300, h2o=0.4, alpha=1.5, beta=0.05)
         self.check_atm_equal(atm1, atm2)
@@ -71,8 +238,7 @@ class TestAtmosphere(TestSolo):
     def test_atm21(self):
         """Test loading of `atm21.dat` from file."""
 
-        path = os.path.join(ATMOSPHERE_FOLDER, "atm21.dat")
-        atm1 = Atmosphere.from_file(path)
+        atm1 = load_atmosphere("atm21.dat")
         atm2 = Atmosphere(
             p=800, rho=0.2, o3=300, h2o=0.4, alpha=1.5, beta=0.05,
             w0=0.85, g=0.95)
@@ -81,8 +247,7 @@ class TestAtmosphere(TestSolo):
     def test_atm22(self):
         """Test loading of `atm22.dat` from file."""
 
-        path = os.path.join(ATMOSPHERE_FOLDER, "atm22.dat")
-        atm1 = Atmosphere.from_file(path)
+        atm1 = load_atmosphere("atm22.dat")
         atm2 = Atmosphere(
             p=800, rho=0.2, o3=300, h2o=0.4, alpha=1.5, beta=0.05)
         self.check_atm_equal(atm1, atm2)
@@ -90,8 +255,7 @@ class TestAtmosphere(TestSolo):
     def test_atm31(self):
         """Test loading of `atm31.dat` from file."""
 
-        path = os.path.join(ATMOSPHERE_FOLDER, "atm31.dat")
-        atm1 = Atmosphere.from_file(path)
+        atm1 = load_atmosphere("atm31.dat")
         atm2 = Atmosphere(
             p=np.array([800, 875, 880]),
             rho=np.array([0.2, 0.3, 0.25]),
@@ -106,8 +270,7 @@ class TestAtmosphere(TestSolo):
     def test_atm32(self):
         """Test loading of `atm32.dat` from file."""
 
-        path = os.path.join(ATMOSPHERE_FOLDER, "atm32.dat")
-        atm1 = Atmosphere.from_file(path)
+        atm1 = load_atmosphere("atm32.dat")
         atm2 = Atmosphere(
             p=np.array([800, 875, 880]),
             rho=np.array([0.2, 0.3, 0.25]),
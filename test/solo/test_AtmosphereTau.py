@@ -31,93 +31,45 @@ from . import TestSolo
 class TestAtmosphereTau(TestSolo):
     """Specific optical thickness tests for the :class:`Atmosphere` class."""
 
-    def test_tau_rayleigh_atm0d_val0d(self):
+    def check_tau(self, method, obj0):
+        """Test an optical thickness method against its reference data."""
+
+        nwvln = (self.wvln_um.size,)
+        cases = [
+            ("atm0d_val0d", self.atm0, self.wvln_um[0], 2 * self.ONE),
+            ("atm0d_val1d", self.atm0, self.wvln_um, self.ONE + nwvln),
+            ("atm1d_val0d", self.atm1, self.wvln_um[0],
+             (self.atm1.nscen,) + self.ONE),
+            ("atm1d_val1d", self.atm1, self.wvln_um,
+             (self.atm1.nscen,) + nwvln),
+        ]
+
+        for name, atm, wvln_um, shp1 in cases:
+            with self.subTest(case=name):
+                obj1 = getattr(atm, method)(wvln_um)
+                self.check_reference(obj1, obj0, wvln_um, shp1)
+
+    def test_tau_rayleigh(self):
         """Test Rayleigh optical thickness."""
 
-        shp0 = ()
-        obj0 = self.result["tau_ray"]
-        shp1 = 2 * self.one() + shp0
-        obj1 = self.atm0.tau_rayleigh(self.wvln_um[0])
-        flag = np.allclose(obj1, obj0[0], self.delta)
-        self.assertTupleEqual(obj1.shape, shp1)
-        self.assertTrue(flag)
+        self.check_tau("tau_rayleigh", self.tau_ray)
 
-    def test_tau_rayleigh_atm0d_val1d(self):
-        """Test Rayleigh optical thickness."""
-
-        shp0 = (self.wvln_um.size,)
-        obj0 = self.result["tau_ray"]
-        shp1 = self.one() + shp0
-        obj1 = self.atm0.tau_rayleigh(self.wvln_um)
-        flag = np.allclose(obj1, obj0, self.delta)
-        self.assertTupleEqual(obj1.shape, shp1)
-        self.assertTrue(flag)
-
-    def test_tau_rayleigh_atm1d_val0d(self):
-        """Test Rayleigh optical thickness."""
-
-        shp0 = (self.atm1.nscen,)
-        obj0 = self.result["tau_ray"]
-        shp1 = shp0 + self.one()
-        obj1 = self.atm1.tau_rayleigh(self.wvln_um[0])
-        flag = np.allclose(obj1[0], obj0[0], self.delta)
-        self.assertTupleEqual(obj1.shape, shp1)
-        self.assertTrue(flag)
-
-    def test_tau_rayleigh_atm1d_val1d(self):
-        """Test Rayleigh optical thickness."""
-
-        shp0 = (self.atm1.nscen, self.wvln_um.size,)
-        obj0 = self.result["tau_ray"]
-        shp1 = shp0
-        obj1 = self.atm1.tau_rayleigh(self.wvln_um)
-        flag = np.allclose(obj1[0], obj0, self.delta)
-        self.assertTupleEqual(obj1.shape, shp1)
-        self.assertTrue(flag)
-
-    def test_tau_aerosols_atm0d_val0d(self):
-        """Test aerosol optical thickness."""
-
-        shp0 = ()
-        obj0 = self.result["tau_aer"]
-        shp1 = 2 * self.one() + shp0
-        obj1 = self.atm0.tau_aerosols(self.wvln_um[0])
-        flag = np.allclose(obj1, obj0[0], self.delta)
-        self.assertTupleEqual(obj1.shape, shp1)
-        self.assertTrue(flag)
-
-    def test_tau_aerosols_atm0d_val1d(self):
+    def test_tau_aerosols(self):
         """Test aerosol optical thickness."""
 
-        shp0 = (self.wvln_um.size,)
-        obj0 = self.result["tau_aer"]
-        shp1 = self.one() + shp0
-        obj1 = self.atm0.tau_aerosols(self.wvln_um)
-        flag = np.allclose(obj1, obj0, self.delta)
-        self.assertTupleEqual(obj1.shape, shp1)
-        self.assertTrue(flag)
+        self.check_tau("tau_aerosols", self.tau_aer)
 
-    def test_tau_aerosols_atm1d_val0d(self):
-        """Test aerosol optical thickness."""
-
-        shp0 = (self.atm1.nscen,)
-        obj0 = self.result["tau_aer"]
-        shp1 = shp0 + self.one()
-        obj1 = self.atm1.tau_aerosols(self.wvln_um[0])
-        flag = np.allclose(obj1[0], obj0[0], self.delta)
-        self.assertTupleEqual(obj1.shape, shp1)
-        self.assertTrue(flag)
-
-    def test_tau_aerosols_atm1d_val1d(self):
-        """Test aerosol optical thickness."""
+    def test_tau_out(self):
+        """Test optical thickness stored in preallocated arrays."""
 
-        shp0 = (self.atm1.nscen, self.wvln_um.size,)
-        obj0 = self.result["tau_aer"]
-        shp1 = shp0
-        obj1 = self.atm1.tau_aerosols(self.wvln_um)
-        flag = np.allclose(obj1[0], obj0, self.delta)
-        self.assertTupleEqual(obj1.shape, shp1)
-        self.assertTrue(flag)
+        for name in ["tau_rayleigh", "tau_aerosols"]:
+            with self.subTest(method=name):
+                func = getattr(self.atm1, name)
+                obj0 = func(self.wvln_um)
+                out = np.empty_like(obj0)
+                obj1 = func(self.wvln_um, out=out)
+                self.assertIs(obj1, out)
+                self.assertTrue(np.array_equal(obj1, obj0))
 
 
 if __name__ == "__main__":
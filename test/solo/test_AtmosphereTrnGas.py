@@ -25,6 +25,7 @@ except ImportError:
     import unittest
 
 import numpy as np
+from solo.api._spectral import _oxygen_coef_pow
 from . import TestSolo
 
 
@@ -41,92 +42,106 @@ class TestAtmosphereTrnGas(TestSolo):
         trn3 = atm.trn_oxygen(*args)
         return trn1 * trn2 * trn3
 
-    def test_trn_gas_geo0d_atm0d_val0d(self):
+    def test_trn_gas(self):
         """Test total gas transmission."""
 
-        obj0 = self.result["tdir_gas"]
-        shp1 = 2 * self.one()
-        obj1 = self.calc_obj1(self.geo0, self.atm0, self.wvln[0])
-        flag = np.allclose(obj1, obj0[0], self.delta)
-        self.assertTupleEqual(obj1.shape, shp1)
+        obj0 = self.tdir_gas
+        nwvln = (self.wvln.size,)
+        cases = [
+            ("geo0d_atm0d_val0d", self.geo0, self.atm0, self.wvln[0],
+             2 * self.ONE),
+            ("geo0d_atm0d_val1d", self.geo0, self.atm0, self.wvln,
+             self.ONE + nwvln),
+            ("geo0d_atm1d_val0d", self.geo0, self.atm1, self.wvln[0],
+             (self.atm1.nscen,) + self.ONE),
+            ("geo0d_atm1d_val1d", self.geo0, self.atm1, self.wvln,
+             (self.atm1.nscen,) + nwvln),
+            ("geo1d_atm0d_val0d", self.geo1, self.atm0, self.wvln[0],
+             (self.geo1.ngeo,) + self.ONE),
+            ("geo1d_atm0d_val1d", self.geo1, self.atm0, self.wvln,
+             (self.geo1.ngeo,) + nwvln),
+            ("geo1d_atm1d_val0d", self.geo1, self.atm1, self.wvln[0],
+             (self.geo1.ngeo,) + self.ONE),
+            ("geo1d_atm1d_val1d", self.geo1, self.atm1, self.wvln,
+             (self.geo1.ngeo,) + nwvln),
+        ]
+
+        for name, geo, atm, wvln, shp1 in cases:
+            with self.subTest(case=name):
+                obj1 = self.calc_obj1(geo, atm, wvln)
+                self.check_reference(obj1, obj0, wvln, shp1)
+                # The fused method must match the product of the three.
+                obj2 = atm.trn_gas(wvln, geo.mu0)
+                self.assertTupleEqual(obj2.shape, shp1)
+                self.assertTrue(np.allclose(obj2, obj1, rtol=1E-12))
+
+    def test_trn_gas_repeated_wvln(self):
+        """Test total gas transmission for repeated wavelength grids."""
+
+        wvln = self.wvln.copy()
+        obj1 = self.calc_obj1(self.geo0, self.atm0, wvln)
+        obj2 = self.calc_obj1(self.geo0, self.atm0, wvln)
+        self.assertTrue(np.array_equal(obj1, obj2))
+
+        # Modifying the grid in place must not reuse the previous results.
+        wvln[:] = wvln[::-1]
+        obj3 = self.calc_obj1(self.geo0, self.atm0, wvln)
+        flag = np.allclose(obj3[0], self.tdir_gas[::-1], self.delta)
         self.assertTrue(flag)
 
-    def test_trn_gas_geo0d_atm0d_val1d(self):
-        """Test total gas transmission."""
-
-        shp0 = (self.wvln.size,)
-        obj0 = self.result["tdir_gas"]
-        shp1 = self.one() + shp0
-        obj1 = self.calc_obj1(self.geo0, self.atm0, self.wvln)
-        flag = np.allclose(obj1, obj0, self.delta)
-        self.assertTupleEqual(obj1.shape, shp1)
-        self.assertTrue(flag)
-
-    def test_trn_gas_geo0d_atm1d_val0d(self):
-        """Test total gas transmission."""
-
-        shp0 = (self.atm1.nscen,)
-        obj0 = self.result["tdir_gas"]
-        shp1 = shp0 + self.one()
-        obj1 = self.calc_obj1(self.geo0, self.atm1, self.wvln[0])
-        flag = np.allclose(obj1[0], obj0[0], self.delta)
-        self.assertTupleEqual(obj1.shape, shp1)
-        self.assertTrue(flag)
-
-    def test_trn_gas_geo0d_atm1d_val1d(self):
-        """Test total gas transmission."""
-
-        shp0 = (self.atm1.nscen, self.wvln.size)
-        obj0 = self.result["tdir_gas"]
-        shp1 = shp0
-        obj1 = self.calc_obj1(self.geo0, self.atm1, self.wvln)
-        flag = np.allclose(obj1[0, :], obj0, self.delta)
-        self.assertTupleEqual(obj1.shape, shp1)
-        self.assertTrue(flag)
-
-    def test_trn_gas_geo1d_atm0d_val0d(self):
-        """Test total gas transmission."""
-
-        shp0 = (self.geo1.ngeo,)
-        obj0 = self.result["tdir_gas"]
-        shp1 = shp0 + self.one()
-        obj1 = self.calc_obj1(self.geo1, self.atm0, self.wvln[0])
-        flag = np.allclose(obj1[0], obj0[0], self.delta)
-        self.assertTupleEqual(obj1.shape, shp1)
-        self.assertTrue(flag)
-
-    def test_trn_gas_geo1d_atm0d_val1d(self):
-        """Test total gas transmission."""
-
-        shp0 = (self.geo1.ngeo, self.wvln.size)
-        obj0 = self.result["tdir_gas"]
-        shp1 = shp0
-        obj1 = self.calc_obj1(self.geo1, self.atm0, self.wvln)
-        flag = np.allclose(obj1[0], obj0, self.delta)
-        self.assertTupleEqual(obj1.shape, shp1)
-        self.assertTrue(flag)
-
-    def test_trn_gas_geo1d_atm1d_val0d(self):
-        """Test total gas transmission."""
-
-        shp0 = (self.geo1.ngeo,)
-        obj0 = self.result["tdir_gas"]
-        shp1 = shp0 + self.one()
-        obj1 = self.calc_obj1(self.geo1, self.atm1, self.wvln[0])
-        flag = np.allclose(obj1[0, 0], obj0[0], self.delta)
-        self.assertTupleEqual(obj1.shape, shp1)
-        self.assertTrue(flag)
-
-    def test_trn_gas_geo1d_atm1d_val1d(self):
-        """Test total gas transmission."""
-
-        shp0 = (self.geo1.ngeo, self.wvln.size)
-        obj0 = self.result["tdir_gas"]
-        shp1 = shp0
-        obj1 = self.calc_obj1(self.geo1, self.atm1, self.wvln)
-        flag = np.allclose(obj1[0], obj0, self.delta)
-        self.assertTupleEqual(obj1.shape, shp1)
-        self.assertTrue(flag)
+    def test_trn_gas_out(self):
+        """Test gas transmission stored in preallocated arrays."""
+
+        args = [self.wvln, self.geo1.mu0]
+        for name in ["trn_water", "trn_ozone", "trn_oxygen", "trn_gas"]:
+            with self.subTest(method=name):
+                func = getattr(self.atm1, name)
+                obj0 = func(*args)
+                out = np.empty_like(obj0)
+                obj1 = func(*args, out=out)
+                self.assertIs(obj1, out)
+                self.assertTrue(np.array_equal(obj1, obj0))
+
+    def test_trn_gas_out_error(self):
+        """Test gas transmission with invalid preallocated arrays."""
+
+        args = [self.wvln, self.geo1.mu0]
+        shape = (self.atm1.nscen, self.wvln.size)
+        cases = [
+            ("invalid_dtype", np.empty(shape, dtype=int)),
+            ("invalid_nscen", np.empty((shape[0] + 1, shape[1]))),
+            ("invalid_nwvln", np.empty((shape[0], shape[1] - 1))),
+            ("invalid_ndim", np.empty(shape[::-1] + (1,))),
+            ("invalid_type", [[0.0] * shape[1]] * shape[0]),
+        ]
+        for name in ["trn_water", "trn_ozone", "trn_oxygen", "trn_gas"]:
+            func = getattr(self.atm1, name)
+            for case, out in cases:
+                with self.subTest(method=name, case=case):
+                    self.assertRaises(ValueError, func, *args, out=out)
+
+    def test_trn_water_dry(self):
+        """Test water vapour transmission without water vapour."""
+
+        atm = self.atm0._replace(h2o=[0.0])
+        obj1 = atm.trn_water(self.wvln, self.geo0.mu0)
+        self.assertTrue(np.array_equal(obj1, np.ones_like(obj1)))
+
+    def test_trn_oxygen_night(self):
+        """Test oxygen transmission with the Sun below the horizon."""
+
+        # The power of a negative `mu0` is not defined, but the wavelengths
+        # without oxygen absorption must still be fully transmitted.
+        mu0 = np.array([-0.5])
+        inactive = _oxygen_coef_pow(self.wvln) == 0
+        self.assertTrue(inactive.any())
+        with np.errstate(invalid="ignore", over="ignore"):
+            obj1 = self.atm0.trn_oxygen(self.wvln, mu0)
+            obj2 = self.atm0.trn_gas(self.wvln, mu0)
+            obj3 = (self.atm0.trn_water(self.wvln, mu0) *
+                    self.atm0.trn_ozone(self.wvln, mu0) * obj1)
+        self.assertTrue(np.all(obj1[:, inactive] == 1))
+        self.assertTrue(np.array_equal(np.isnan(obj2), np.isnan(obj3)))
 
 
 if __name__ == "__main__":
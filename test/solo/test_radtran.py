@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2017-2019, 2023 Víctor Molina García
+#
+# This file is part of solo.
+#
+# solo is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# solo is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with solo; if not, see <https://www.gnu.org/licenses/>.
+#
+"""Basic tests for the :func:`radtran` function."""
+
+import os.path
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+import numpy as np
+from solo import radtran
+from solo.radtran import KURUCZ
+from solo.radtran import KURUCZ_PATH
+from . import TestSolo
+
+
+class TestRadtran(TestSolo):
+    """Basic tests for the :func:`radtran` function."""
+
+    def test_kurucz(self):
+        """Test the binary copy of the TOA irradiances file."""
+
+        obj0 = np.loadtxt(KURUCZ_PATH).T
+        self.assertTrue(np.array_equal(KURUCZ, obj0))
+        self.assertFalse(KURUCZ.flags.writeable)
+
+    def test_radtran(self):
+        """Test the consistency of the BOA irradiances."""
+
+        for coupling in [True, False]:
+            with self.subTest(coupling=coupling):
+                out = radtran(self.geo1, self.atm1, coupling=coupling)
+                irr_glb, irr_dir, irr_dif = out
+                shp1 = (self.geo1.ngeo, KURUCZ.shape[1])
+                mu0 = self.geo1.mu0[:, None]
+                for irr in out:
+                    self.assertTupleEqual(irr.shape, shp1)
+                self.assertTrue(np.allclose(irr_glb, irr_dir * mu0 + irr_dif))
+
+    def test_radtran_reference(self):
+        """Test the BOA irradiances against the reference data."""
+
+        # The reference file stores the irradiances in mW m-2 nm-1 for the
+        # scalar reference instances, where the global, direct and diffuse
+        # irradiances are its third, fourth and sixth columns.
+        here = os.path.dirname(__file__)
+        path = os.path.join(here, "dat", "irradiance.dat")
+        data = 1E-3 * np.loadtxt(path, usecols=(2, 3, 5)).T
+
+        out = radtran(self.geo0, self.atm0)
+        for name, irr, obj0 in zip(["glb", "dir", "dif"], out, data):
+            with self.subTest(irradiance=name):
+                flag = np.allclose(irr[0], obj0, rtol=5E-4, atol=1E-4)
+                self.assertTrue(flag)
+
+
+if __name__ == "__main__":
+    unittest.main()
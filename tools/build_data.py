@@ -0,0 +1,59 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2017-2019, 2023 Víctor Molina García
+#
+# This file is part of solo.
+#
+# solo is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# solo is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with solo; if not, see <https://www.gnu.org/licenses/>.
+#
+"""Script to convert the solo text data files into binary NumPy files."""
+
+from __future__ import print_function
+import sys
+import os.path
+import numpy as np
+
+
+TOOLS_FOLDER = os.path.dirname(os.path.abspath(__file__))
+DATA_FOLDER = os.path.join(
+    os.path.dirname(TOOLS_FOLDER), "src", "solo", "dat")
+
+# Define the text data files and the columns to be converted. The arrays
+# are stored transposed and in C order, so that every row is contiguous.
+DATA_FILES = [
+    ("abscoef.dat", (0, 1, 2, 3, 4)),
+    ("kurucz.dat", (0, 1)),
+]
+
+
+def _main(argv=None):
+    """Main script function."""
+
+    # This script does not accept any argument.
+    argv = argv if argv is not None else sys.argv[1:]
+    if argv:
+        print("Error: unexpected arguments")
+        sys.exit(1)
+
+    for name, usecols in DATA_FILES:
+        src = os.path.join(DATA_FOLDER, name)
+        dst = os.path.splitext(src)[0] + ".npy"
+        data = np.loadtxt(src, usecols=usecols).T
+        np.save(dst, np.ascontiguousarray(data))
+        print("Created {0}".format(dst))
+
+
+if __name__ == "__main__":
+    sys.exit(_main())